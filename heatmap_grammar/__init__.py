@@ -1,6 +1,9 @@
 from .annotations import Annotation, ColumnAnnotation, RowAnnotation
 from .dendrograms import ColumnDendrogram, RowDendrogram
-from .clustering import clustering_distance, inverse_abs_correlation
+from .clustering import (
+    clustering_distance, euclidean_distance, fast_hclust,
+    inverse_abs_correlation
+)
 from .heatmap import cell_overlay, Heatmap, HeatmapTheme
 from .guides import guide_colorbar, guide_colourbar, guide_legend, guides
 from .markdown import markdown
@@ -40,6 +43,8 @@ __all__ = [
     'aes',
     'cell_overlay',
     'clustering_distance',
+    'euclidean_distance',
+    'fast_hclust',
     'inverse_abs_correlation',
     'guide_colorbar',
     'guide_colourbar',
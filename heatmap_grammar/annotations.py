@@ -1,14 +1,17 @@
 from __future__ import annotations
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from typing import (
     Callable, Literal,
     Optional, Union, List
 )
 from warnings import warn
 
-from pandas import DataFrame, Series
+from numpy import add, array, flatnonzero, where, zeros
+from pandas import DataFrame, Series, factorize
 from pandas.api.types import is_numeric_dtype
+from pandas.util import hash_pandas_object
 
 from .constants import unset
 from .r import (
@@ -22,7 +25,7 @@ from .scales import Scale, scale_fill_gradient, scale_identity, scale_fill_rando
 from .guides import GuidesCollection
 from .unit import Unit
 from .utils import isinstance_permissive
-from .rpy2_helpers import py2rpy
+from .rpy2_helpers import py2rpy, py2r_vector
 
 ComplexHeatmapGeom = Literal[
     'simple',
@@ -31,40 +34,119 @@ ComplexHeatmapGeom = Literal[
 ]
 
 
-def only(x):
-    if len(set(x)) != 1:
-        raise ValueError(f'Non-unique values in stat=unique aggregation: {x}')
-    return x[0]
+# geom → grid aesthetic name translations, frozen at module scope
+_DEFAULT_GRAPHICAL_MAP = {
+    'label': 'pch',
+    'color': 'col',
+}
+_MARK_GRAPHICAL_MAP = {
+    'label': 'labels'
+}
+_GP_MAP = {
+    'fill': 'fill',
+    'color': 'col'
+}
+
+
+# prototypes instantiated once; `_default_scale` hands out copies
+# so that fitting one annotation does not affect another
+_DEFAULT_SCALE_PROTOTYPES = {
+    'numeric': scale_fill_gradient(low='white', high='red'),
+    'discrete': scale_fill_random(),
+    'identity': scale_identity(),
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve_geom(name: str):
+    """Resolve `anno_*` constructor once per geom; rpy2 attribute lookup is costly."""
+    return getattr(complex_heatmap, 'anno_' + name)
+
+
+_R_VALUE_CACHE: dict = {}
+_R_VALUE_CACHE_MAX_SIZE = 128
+
+
+def _value_to_r(value: Union[DataFrame, Series]):
+    """Convert annotation values to R, reusing conversions on re-draws.
+
+    Keyed by shape, dtypes and content hash so that redrawing a plot
+    with unchanged annotations skips the conversion round-trip. The
+    dtypes matter: `hash_pandas_object` hashes e.g. booleans and 0/1
+    integers identically, yet they convert to different R vector types.
+    """
+    if isinstance(value, DataFrame):
+        columns = tuple(value.columns)
+        dtypes = str(value.dtypes.to_dict())
+    else:
+        columns = None
+        dtypes = str(value.dtype)
+    key = (
+        value.shape,
+        columns,
+        dtypes,
+        int(hash_pandas_object(value, index=True).sum()),
+    )
+    cached = _R_VALUE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    if isinstance(value, DataFrame):
+        converted = py2rpy(value)
+    else:
+        # typed vector constructors consume the numpy buffer directly,
+        # skipping the `base.c(*...)` per-element argument packing
+        converted = py2r_vector(value.to_numpy())
+    if len(_R_VALUE_CACHE) >= _R_VALUE_CACHE_MAX_SIZE:
+        _R_VALUE_CACHE.pop(next(iter(_R_VALUE_CACHE)))
+    _R_VALUE_CACHE[key] = converted
+    return converted
+
+
+def aggregate_unique(value: Series, grouped=None) -> Series:
+    """Collapse duplicated index entries to one value per index.
+
+    Raises if any index holds more than one distinct value; two C-level
+    group reductions instead of a Python call per group. A pre-built
+    `grouped` can be passed to share the grouper between columns.
+    """
+    if grouped is None:
+        grouped = value.groupby(level=0, sort=False)
+    counts = grouped.nunique(dropna=False)
+    non_unique = counts[counts > 1]
+    if len(non_unique):
+        raise ValueError(
+            'Non-unique values in stat=unique aggregation for:'
+            f' {non_unique.index.to_list()}'
+        )
+    return grouped.first()
 
 
 def pivot_count(value: Series) -> DataFrame:
     unique_index = value.index.drop_duplicates()
-    return DataFrame(
-        {
-            category: [
-                sum(value.loc[[index]] == category)
-                for index in unique_index
-            ]
-            for category in sorted(set(value))
-        },
-        index=unique_index
-    )
+    # vectorized histogram over factorized codes; int32 counts halve
+    # the memory bandwidth of the downstream R conversion
+    index_codes, _ = factorize(value.index, sort=False)
+    category_codes, categories = factorize(value, sort=True)
+    counts = zeros((len(unique_index), len(categories)), dtype='int32')
+    # a code of -1 marks missing values, which do not count as a category
+    valid = category_codes >= 0
+    add.at(counts, (index_codes[valid], category_codes[valid]), 1)
+    return DataFrame(counts, index=unique_index, columns=categories)
 
 
 def pivot_identity(value: Series) -> DataFrame:
     unique_index = value.index.drop_duplicates()
-    n_categories = max(value.index.value_counts())
-    return DataFrame(
-        {
-            category: [
-                # TODO: this has a terrible complexity
-                value.loc[[index]].head(category + 1).tail(1).iloc[0]
-                for index in unique_index
-            ]
-            for category in range(n_categories)
-        },
-        index=unique_index
-    )
+    # number the duplicates per index in one pass, then pivot wide;
+    # avoids the O(n·k²) label lookups of the per-cell approach
+    frame = DataFrame({
+        'index': value.index,
+        'position': value.groupby(level=0, sort=False).cumcount().to_numpy(),
+        'value': value.to_numpy(),
+    })
+    wide = frame.pivot(index='index', columns='position', values='value')
+    wide.index.name = value.index.name
+    wide.columns.name = None
+    return wide.reindex(unique_index)
 
 
 @dataclass
@@ -82,25 +164,25 @@ class Annotation:
     position: Literal['stack', 'fill', 'identity', 'dodge', 'auto'] = 'auto'
     geom_arguments: dict = field(default_factory=dict)
     gp_arguments: dict = field(default_factory=dict)
-    active_scales: list = field(default_factory=list, init=False)
+    _active_scales: dict[int, Scale] = field(default_factory=dict, init=False)
     scales: dict[str, Scale] = field(default_factory=dict, init=False)
 
+    @property
+    def active_scales(self) -> list[Scale]:
+        return list(self._active_scales.values())
+
     def _default_scale(self, data: Series, aesthetic: str):
-        defaults_by_dtype = {
-            'numeric': scale_fill_gradient(low='white', high='red'),
-            'discrete': scale_fill_random()
-        }
         if aesthetic in ['fill', 'color']:
             kind = 'numeric' if is_numeric_dtype(data.dtype) else 'discrete'
-            return defaults_by_dtype[kind]
-
-        return scale_identity()
+        else:
+            kind = 'identity'
+        return copy(_DEFAULT_SCALE_PROTOTYPES[kind])
 
-    @property
+    @cached_property
     def name(self) -> str | MarkdownData:
         return self.label or self.mapping.get('value', next(iter(self.mapping.values())))
 
-    @property
+    @cached_property
     def name_object(self):
         return (
             self.label.wrapper
@@ -110,10 +192,14 @@ class Annotation:
 
     def create(self, annotation_group: 'AnnotationGroup'):
         geom = (
-            getattr(complex_heatmap, 'anno_' + self.geom)
+            _resolve_geom(self.geom)
             if isinstance(self.geom, str) else
             self.geom
         )
+        # the geom does not change within a call; compare once
+        is_mark = self.geom == 'mark'
+        is_simple = self.geom == 'simple'
+        use_graphical_map = is_simple or is_mark
         mapping = copy(self.mapping)
         mapping_values = set(mapping.values())
         if 'value' not in mapping and len(mapping_values) == 1:
@@ -126,14 +212,12 @@ class Annotation:
 
         value = mapped_dataset.extract('value')
 
-        if self.geom == 'mark':
-            value = (
-                value
-                .to_frame('value')
-                .assign(number=range(1, len(value) + 1))
-                .where(value)
-                .dropna()
-                ['number']
+        if is_mark:
+            # 1-based positions of truthy rows, without intermediate frames
+            mask = value.to_numpy(dtype=bool, na_value=False)
+            value = Series(
+                flatnonzero(mask) + 1,
+                index=value.index[mask]
             )
 
         stat = self.stat
@@ -144,79 +228,110 @@ class Annotation:
             if self.geom == 'boxplot':
                 stat = 'identity'
 
-        if value.index.duplicated().any():
+        # `has_duplicates` uses the index engine's cached uniqueness flag
+        # instead of allocating and reducing a boolean mask
+        if value.index.has_duplicates:
             if stat == 'count':
                 value = pivot_count(value).loc[mapped_dataset.index]
             elif stat == 'sum':
-                value = value.groupby(value.index).sum()
+                # input is already sorted by `combine()`, so skip the
+                # grouper's own sort pass
+                value = value.groupby(level=0, sort=False).sum()
             elif stat == 'unique':
-                value = value.groupby(value.index).apply(only)
+                value = aggregate_unique(value)
             elif stat == 'identity':
                 # TODO: should transpose later?
                 value = pivot_identity(value).loc[mapped_dataset.index].T
             else:
                 raise ValueError(f'Unknown `stat`={stat}')
 
-        gp_mapping = self.gp_arguments.copy()
-        gp_mp = {
-            'fill': 'fill',
-            'color': 'col'
-        }
-        graphical_map = {
-            'label': 'pch',
-            'color': 'col',
-        }
-        if self.geom == 'mark':
-            graphical_map = {
-                'label': 'labels'
-            }
-
-        scales = self.scales.copy()
+        gp_mapping = {}
+        gp_mp = _GP_MAP
+        graphical_map = (
+            _MARK_GRAPHICAL_MAP
+            if is_mark else
+            _DEFAULT_GRAPHICAL_MAP
+        )
 
         graphical_params = {}
-        self.active_scales = []
+        self._active_scales = {}
+
+        row_idx = value.index
+
+        # align the rows to the value index once (one reindex) rather
+        # than once per aesthetic; frames with duplicated index are
+        # aligned per column after aggregation instead
+        aesthetic_data = mapped_dataset.data
+        has_duplicates = mapped_dataset.has_duplicates
+        if (
+            not has_duplicates
+            and not aesthetic_data.index.equals(row_idx)
+        ):
+            aesthetic_data = aesthetic_data.reindex(row_idx)
+            has_duplicates = aesthetic_data.index.has_duplicates
+
+        # one grouper shared by all aesthetic columns; building it
+        # per column would re-hash the same index every time
+        aesthetic_groups = (
+            aesthetic_data.groupby(level=0, sort=False)
+            if has_duplicates
+            else None
+        )
+
+        # when one column feeds several aesthetics through the same scale,
+        # fit and compute it only once
+        fitted = set()
+        computed = {}
 
         for map_key in mapped_dataset.mapping:
             if map_key == 'value' or map_key == 'split':
                 continue
-            values = mapped_dataset.extract(map_key)
-            if values.index.duplicated().any():
+            values = aesthetic_data.loc[:, mapped_dataset.mapping[map_key]]
+            if has_duplicates:
                 if isinstance(value, DataFrame):
                     if mapping[map_key] != mapping['value']:
                         raise ValueError('Not yet supported')
                     values = value.columns
                 else:
-                    values = (
-                        values.groupby(values.index)
-                        .apply(only)
-                        .loc[value.index]
-                    )
-
-            if map_key in scales:
-                scale = scales[map_key]
+                    values = aggregate_unique(
+                        values,
+                        grouped=aesthetic_groups[
+                            mapped_dataset.mapping[map_key]
+                        ]
+                    ).loc[row_idx]
+
+            if map_key in self.scales:
+                scale = self.scales[map_key]
             else:
                 scale = self._default_scale(values, map_key)
 
-            scale.fit(values, self.name)
-            if scale not in self.active_scales:
-                self.active_scales.append(scale)
+            cache_key = (id(scale), mapped_dataset.mapping[map_key])
+            if cache_key not in fitted:
+                scale.fit(values, self.name)
+                fitted.add(cache_key)
+            # keyed by identity: O(1) and avoids dataclass field-wise `__eq__`
+            self._active_scales.setdefault(id(scale), scale)
 
             matched = False
-            if self.geom == 'simple' or self.geom == 'mark':
+            if use_graphical_map:
                 if map_key in graphical_map:
-                    graphical_key = graphical_map[map_key]
-                    graphical_params[graphical_key] = scale.compute(values)
+                    if cache_key not in computed:
+                        computed[cache_key] = scale.compute(values)
+                    graphical_params[graphical_map[map_key]] = computed[cache_key]
                     matched = True
             else:
                 if map_key in gp_mp:
-                    gp_key = gp_mp[map_key]
-                    gp_mapping[gp_key] = scale.compute(values)
+                    if cache_key not in computed:
+                        computed[cache_key] = scale.compute(values)
+                    gp_mapping[gp_mp[map_key]] = computed[cache_key]
                     matched = True
             if not matched:
                 raise ValueError(f'Unknown aestethic: {map_key}')
 
-        if gp_mapping:
-            graphical_params['gp'] = grid.gpar(**gp_mapping)
+        if gp_mapping or self.gp_arguments:
+            graphical_params['gp'] = grid.gpar(
+                **{**self.gp_arguments, **gp_mapping}
+            )
 
         if annotation_group.which == 'column' and self.height is not None:
             graphical_params['height'] = self.height.to_r()
@@ -224,16 +339,20 @@ class Annotation:
             graphical_params['width'] = self.width.to_r()
 
         if self.position == 'fill':
-            value = value.div(value.sum(axis=1), axis=0)
+            # normalize in place; proportions do not need float64 and
+            # the narrower dtype halves the downstream R conversion
+            proportions = value.to_numpy(dtype='float32')
+            proportions /= proportions.sum(axis=1, keepdims=True)
+            value = DataFrame(
+                proportions,
+                index=value.index,
+                columns=value.columns
+            )
         elif self.position == 'dodge':
             graphical_params['beside'] = True
             graphical_params['attach'] = True
 
-        if isinstance(value, DataFrame):
-            r_value = py2rpy(value)
-        else:
-            # note: to_list() converts to native type such as float instead of np.float64
-            r_value = base.c(*value.to_list())
+        r_value = _value_to_r(value)
         return geom(
             r_value,
             which=annotation_group.which,
@@ -241,14 +360,21 @@ class Annotation:
             **self.geom_arguments,
         )
 
+    def _invalidate_name_cache(self):
+        for cached in ('name', 'name_object'):
+            self.__dict__.pop(cached, None)
+
     def update(self, **kwargs):
         for k, v in kwargs.items():
             setattr(self, k, v)
+        self._invalidate_name_cache()
         return self
 
     def __add__(self, other):
-        result = copy(self)
-        result.scales = copy(result.scales)
+        # `replace` skips the generic pickle-style copy path and gives
+        # a fresh instance with no stale cached properties
+        result = replace(self)
+        result.scales = {**self.scales}
         # note: order matters (GuidesCollection is a dict too)
         if isinstance_permissive(other, GuidesCollection):
             for k, v in other.items():
@@ -268,12 +394,19 @@ class MappedDataset:
     data: DataFrame
     mapping: dict
 
+    def __post_init__(self):
+        # queried once per layer and per aesthetic, so compute up front;
+        # `has_duplicates` relies on the index engine's cached uniqueness
+        self.has_duplicates = self.data.index.has_duplicates
+        self._unique_index = self.data.index.unique()
+
     @property
     def index(self):
-        return self.data.index.drop_duplicates()
+        return self._unique_index
 
     def extract(self, variable: str):
-        return self.data[self.mapping[variable]]
+        # single-label `.loc` returns a view where possible, avoiding a copy
+        return self.data.loc[:, self.mapping[variable]]
 
 
 @dataclass
@@ -288,6 +421,10 @@ class AnnotationGroup(PlotComponent):
     height: Unit | None = None
     width: Unit | None = None
     allow_missing: bool = False
+    _sorted_data: DataFrame | None = field(default=None, init=False, repr=False)
+    _sorted_data_for: int | None = field(default=None, init=False, repr=False)
+    _layer_meta_cache: dict | None = field(default=None, init=False, repr=False)
+    _combined_default: 'MappedDataset | None' = field(default=None, init=False, repr=False)
 
     @property
     def legends(self) -> list:
@@ -301,6 +438,10 @@ class AnnotationGroup(PlotComponent):
     def set_data(self, data: DataFrame):
         new = copy(self)
         new.data = data
+        new._sorted_data = None
+        new._sorted_data_for = None
+        new._layer_meta_cache = None
+        new._combined_default = None
         return new
 
     def constructor(self, *args, **kwargs):
@@ -316,22 +457,34 @@ class AnnotationGroup(PlotComponent):
         - combined mapping of annotation group and annotation (if provided)
         - annotation group data or provided group data
         """
+        is_default = data is None and mapping is None
+        if is_default and self._combined_default is not None:
+            return self._combined_default
+
         if data is None:
             data = self.data
 
-        data = data.sort_index()
-        self._check_axes(data)
+        # sorting is O(n log n) and copies; do it once per dataframe
+        # as `combine()` gets called for each layer on every render
+        if self._sorted_data_for == id(data) and self._sorted_data is not None:
+            data = self._sorted_data
+        else:
+            source_id = id(data)
+            if not data.index.is_monotonic_increasing:
+                data = data.sort_index()
+            self._check_axes(data)
+            self._sorted_data = data
+            self._sorted_data_for = source_id
 
-        combined_mapping: dict = {}
-        if self.mapping:
-            combined_mapping = copy(self.mapping)
-        if mapping:
-            combined_mapping.update(mapping)
+        combined_mapping = {**(self.mapping or {}), **(mapping or {})}
 
-        return MappedDataset(
+        result = MappedDataset(
             data=data,
             mapping=combined_mapping
         )
+        if is_default:
+            self._combined_default = result
+        return result
 
     def extract_values(self, variable: str):
         """Extract values from annotation group data and mapping."""
@@ -339,11 +492,6 @@ class AnnotationGroup(PlotComponent):
         return dataset.extract(variable)
 
     def create(self, plot: Plot):
-
-        annotations = {
-            str(layer.name): layer.create(self)
-            for layer in self.layers
-        }
         kwargs = {}
         for key in ['gap', 'width', 'height']:
             value = getattr(self, key)
@@ -351,39 +499,59 @@ class AnnotationGroup(PlotComponent):
                 kwargs[key] = value.to_r()
         if len(self.layers) == 0:
             warn('Empty annotation')
+
+        # the label metadata R vectors depend only on `self.layers`,
+        # so re-renders of the same group reuse them; `__add__` and
+        # `set_data` produce instances with an empty cache
+        meta = self._layer_meta_cache
+        if meta is None:
+            # one pass over layers instead of one per aesthetic;
+            # `layer.name` is a property, so resolve it once per layer
+            names = []
+            annotation_labels = {}
+            label_sizes = []
+            label_rotations = []
+            label_sides = []
+            for layer in self.layers:
+                name = str(layer.name)
+                names.append(name)
+                annotation_labels[name] = layer.name_object
+                label_sizes.append(layer.label_size)
+                label_rotations.append(layer.label_rotation)
+                label_sides.append(layer.label_side)
+            label_sides = where(
+                array(label_sides, dtype=object) == 'auto',
+                self.default_label_side,
+                label_sides
+            )
+            meta = {
+                'names': names,
+                'name_gp': grid.gpar(fontsize=py2r_vector(label_sizes)),
+                'name_rot': py2r_vector(label_rotations),
+                'name_side': py2r_vector(label_sides),
+                'label': base.list(**annotation_labels),
+            }
+            self._layer_meta_cache = meta
+
+        annotations = {
+            name: layer.create(self)
+            for name, layer in zip(meta['names'], self.layers)
+        }
+
         return self.constructor(
             **annotations,
-            annotation_name_gp=grid.gpar(fontsize=base.c(*[
-                layer.label_size
-                for layer in self.layers
-            ])),
+            annotation_name_gp=meta['name_gp'],
             show_legend=True,
             #simple_anno_size_adjust=True,
             # TODO
-            annotation_name_rot=base.c(*[
-                layer.label_rotation
-                for layer in self.layers
-            ]),
-            annotation_name_side=base.c(*[
-                (
-                    self.default_label_side
-                    if layer.label_side == 'auto'
-                    else layer.label_side
-                )
-                for layer in self.layers
-            ]),
-            annotation_label=base.list(**{
-                str(layer.name): layer.name_object
-                for layer in self.layers
-            }),
+            annotation_name_rot=meta['name_rot'],
+            annotation_name_side=meta['name_side'],
+            annotation_label=meta['label'],
             **kwargs
             #annotation_legend_param=self.legends
         )
 
     def __add__(self, annotation: Union[Annotation, List[Annotation]]):
-        result = copy(self)
-        result.layers = copy(result.layers)
-
         if annotation is None:
             annotations = []
         elif not isinstance(annotation, list):
@@ -391,20 +559,27 @@ class AnnotationGroup(PlotComponent):
         else:
             annotations = annotation
 
+        layers = [*self.layers]
+        mapping = self.mapping
+
         for annotation in annotations:
-            if (
+            # exact isinstance first; the permissive MRO-walking checks
+            # only run when the cheap checks miss (IPython reloading)
+            if isinstance(annotation, Annotation):
+                layers.append(annotation)
+            elif isinstance(annotation, GuidesCollection):
+                layers[-1] += annotation
+            elif (
                 isinstance_permissive(annotation, dict)
                 and not isinstance_permissive(annotation, GuidesCollection)
             ):
-                result.mapping = copy(result.mapping)
-                if result.mapping is None:
-                    result.mapping = {}
-                result.mapping.update(annotation)
+                mapping = dict(mapping or ())
+                mapping.update(annotation)
             elif not isinstance_permissive(annotation, Annotation):
-                result.layers[-1] += annotation
+                layers[-1] += annotation
             else:
-                result.layers.append(annotation)
-        return result
+                layers.append(annotation)
+        return replace(self, layers=layers, mapping=mapping)
 
     def check_no_none(self, kwargs):
         for k, v in kwargs.items():
@@ -2,10 +2,24 @@ from typing import Any
 
 
 class Sentinel:
+    _registry: 'dict[str, Sentinel]' = {}
+
+    def __new__(cls, name: str):
+        # intern per name so that equality is identity in the common case
+        interned = cls._registry.get(name)
+        if interned is not None and type(interned) is cls:
+            return interned
+        instance = super().__new__(cls)
+        cls._registry[name] = instance
+        return instance
+
     def __init__(self, name: str):
         self.name = name
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        # name-based fallback keeps equality across IPython reloads
         return (
             hasattr(other, 'name')
             and
@@ -18,6 +32,8 @@ class Sentinel:
             )
         )
 
+    __hash__ = object.__hash__
+
     def __repr__(self):
         return self.name
 
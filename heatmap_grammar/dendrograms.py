@@ -19,13 +19,44 @@ class Dendrogram:
     axis: str = ''
     decorate: Callable | None = None
 
+    # parameter names depend only on the axis, so format them once
+    # per class instead of on every `params()` call
+    _param_keys = ('show__dend', '_dend_side', '_dend_reorder')
+    _height_param_key = '_dend_height'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        axis = getattr(cls, 'axis', '')
+        if isinstance(axis, str):
+            cls._param_keys = (
+                f'show_{axis}_dend',
+                f'{axis}_dend_side',
+                f'{axis}_dend_reorder',
+            )
+            cls._height_param_key = f'{axis}_dend_height'
+
     def params(self):
-        axis = self.axis
-        return {
-            f'show_{axis}_dend': self.show,
-            f'{axis}_dend_side': self.side,
-            f'{axis}_dend_reorder': self.reorder
-        }
+        return dict(zip(
+            self._axis_param_keys(),
+            (self.show, self.side, self.reorder)
+        ))
+
+    def _axis_param_keys(self):
+        # the precomputed tuples assume the class-level axis; fall back
+        # to formatting when `axis` was overridden per instance,
+        # e.g. `Dendrogram(axis='row')`
+        if self.axis == type(self).axis:
+            return self._param_keys
+        return (
+            f'show_{self.axis}_dend',
+            f'{self.axis}_dend_side',
+            f'{self.axis}_dend_reorder',
+        )
+
+    def _axis_height_param_key(self):
+        if self.axis == type(self).axis:
+            return self._height_param_key
+        return f'{self.axis}_dend_height'
 
     def _get_dend(self, ht_list, name: str):
         getter = getattr(complex_heatmap, f'{self.axis}_dend')
@@ -62,8 +93,7 @@ class ColumnDendrogram(Dendrogram):
     height: Unit = Unit(1, 'cm')
 
     def params(self):
-        axis = self.axis
         return {
             **super().params(),
-            f'{axis}_dend_height': self.height,
+            self._axis_height_param_key(): self.height,
         }
\ No newline at end of file
@@ -41,9 +41,12 @@ class Guide:
     border: str = unset
     background: str = unset
 
+    # not annotated on purpose, so it does not become a dataclass field
+    _SHARED_ARGUMENTS = ('border', 'background', 'direction')
+
     def _shared_arguments(self) -> dict:
         args = {}
-        for arg in ['border', 'background', 'direction']:
+        for arg in self._SHARED_ARGUMENTS:
             value = getattr(self, arg)
             if value is None:
                 value = NULL
@@ -138,3 +141,11 @@ GUIDE_REGISTER = {
     'none': guide_none,
     None: guide_none
 }
+
+# constructed once at import; scales shallow-copy these instead of
+# re-running the dataclass __init__ and required-field check on every
+# guide resolution
+GUIDE_PROTOTYPES = {
+    key: cls()
+    for key, cls in GUIDE_REGISTER.items()
+}
@@ -18,7 +18,7 @@ from .annotations import ColumnAnnotation
 from .constants import unset, required
 from .dendrograms import Dendrogram, RowDendrogram, ColumnDendrogram
 from .plot import Plot, PlotComponent, Theme
-from .rpy2_helpers import py2rpy
+from .rpy2_helpers import py2rpy, py2r_vector, df_to_r_matrix
 from .r import (
     complex_heatmap,
     base,
@@ -32,6 +32,10 @@ from .unit import Unit
 
 LegendAlignment = Literal['heatmap_center', 'heatmap_top', 'global_center']
 
+_COERCE_TO_VECTOR = frozenset({
+    'column_split', 'row_split', 'row_labels', 'column_labels'
+})
+
 
 def cell_overlay(function):
     @rternalize
@@ -66,12 +70,14 @@ class HeatmapTheme(Theme):
 
 
 def vector_or_null(data: Union[None, Iterable]):
-    return base.c(*data) if data is not None else NULL
+    return py2r_vector([*data]) if data is not None else NULL
 
 
 def default_heatmap_scales(dtypes: Iterable):
-    dtypes = list(set(dtypes))
+    # `unique()` runs in C; `set()` would hash dtype objects one by one
+    dtypes = Series(dtypes).unique()
     if len(dtypes) != 1:
+        dtypes = list(dtypes)
         warn(f'More than one data type {dtypes}: cannot resolve default scale')
         return {}
     dtype = dtypes[0]
@@ -160,10 +166,17 @@ class Heatmap(PlotComponent):
                 order = Series([*value])
                 if is_numeric_dtype(order):
                     order = order - 1
-                    column_order = base.c(*getattr(self.data, axis)[order])
-                    setattr(self, attr, base.c(*column_order))
-
-        self.data = self.data.sort_index(axis=0).sort_index(axis=1)
+                    # one buffer conversion instead of a double `base.c` splat
+                    setattr(
+                        self, attr,
+                        py2r_vector(getattr(self.data, axis)[order])
+                    )
+
+        # sorting copies the whole matrix; skip it when already ordered
+        if not self.data.index.is_monotonic_increasing:
+            self.data = self.data.sort_index(axis=0)
+        if not self.data.columns.is_monotonic_increasing:
+            self.data = self.data.sort_index(axis=1)
         self._check_axes(self.data)
 
     @property
@@ -188,34 +201,38 @@ class Heatmap(PlotComponent):
         except AttributeError as e:
             raise ValueError(e)
 
+    # class-level tuples: rebuilt lists and repeated attribute probing
+    # would run on every draw
+    _PLOT_FORWARD = ('column_split', 'row_split')
+    _SELF_FORWARD = (
+        'row_labels', 'column_labels',
+        'height', 'width',
+        'row_gap', 'column_gap',
+        'column_order', 'row_order',
+        'show_row_names', 'show_column_names',
+        'cluster_rows', 'cluster_columns',
+        'layer_fun', 'column_names_rot',
+        'cell_fun'
+    )
+
     def heatmap(self, plot: Plot, data: DataFrame, *args, **kwargs):
-        if hasattr(plot, 'row_order'):
-            kwargs['row_order'] = base.c(*plot.row_order)
-        if_not_none = ['column_split', 'row_split']
+        plot_attributes = plot.__dict__
+        if 'row_order' in plot_attributes:
+            kwargs['row_order'] = py2r_vector([*plot_attributes['row_order']])
 
-        for argument in if_not_none:
-            value = getattr(plot, argument)
+        for argument in self._PLOT_FORWARD:
+            value = plot_attributes.get(argument)
             if value is not None:
                 kwargs[argument] = value
 
         for dendrogram in self.dendrograms.values():
             kwargs.update(dendrogram.params())
 
-        if_not_unset_self = [
-            'row_labels', 'column_labels',
-            'height', 'width',
-            'row_gap', 'column_gap',
-            'column_order', 'row_order',
-            'show_row_names', 'show_column_names',
-            'cluster_rows', 'cluster_columns',
-            'layer_fun', 'column_names_rot',
-            'cell_fun'
-        ]
-
-        for argument in if_not_unset_self:
-            value = getattr(self, argument)
-            if value is not unset:
-                kwargs[argument] = value
+        kwargs.update({
+            argument: value
+            for argument in self._SELF_FORWARD
+            if (value := getattr(self, argument)) is not unset
+        })
 
         for key, value in kwargs.items():
             # convert Unit and others as needed
@@ -251,10 +268,10 @@ class Heatmap(PlotComponent):
             else:
                 kwargs['top_annotation'] = NULL
 
-        coerce_to_list = ['column_split', 'row_split', 'row_labels', 'column_labels']
-        for key in coerce_to_list:
-            if key in kwargs and isinstance_permissive(kwargs[key], Series):
-                kwargs[key] = base.c(*kwargs[key])
+        for key in kwargs.keys() & _COERCE_TO_VECTOR:
+            value = kwargs[key]
+            if isinstance(value, Series):
+                kwargs[key] = py2r_vector(value)
 
         kwargs = {
             k: v
@@ -262,8 +279,14 @@ class Heatmap(PlotComponent):
             if v is not unset
         }
 
+        if all(is_numeric_dtype(dtype) for dtype in data.dtypes):
+            # one column-major memcpy instead of per-column data.frame build
+            r_data = df_to_r_matrix(data)
+        else:
+            r_data = py2rpy(data)
+
         return complex_heatmap.Heatmap(
-            py2rpy(data),
+            r_data,
             *args,
             name=self.name,
             border=self.border,
@@ -290,16 +313,26 @@ class Heatmap(PlotComponent):
     def create(self, plot: Plot):
         molecule_abundance = self.data
         if self.weight:
-            weights = self.weight(molecule_abundance)
-
-            molecule_abundance = molecule_abundance.apply(
-                lambda a: a.multiply(weights.reindex(molecule_abundance.index).fillna(1))
+            # one row-wise broadcast instead of a Python call per column
+            weights = (
+                self.weight(molecule_abundance)
+                .reindex(molecule_abundance.index)
+                .fillna(1)
             )
+            molecule_abundance = molecule_abundance.mul(weights, axis=0)
 
-        # order is maintained between annotation and matrix by sorting the columns (patients)
-        molecule_abundance = molecule_abundance[sorted(molecule_abundance.columns)]
+        # order is maintained between annotation and matrix by sorting the columns (patients);
+        # `__post_init__` already sorted them, so this only runs if the frame changed since
+        if not molecule_abundance.columns.is_monotonic_increasing:
+            molecule_abundance = molecule_abundance[sorted(molecule_abundance.columns)]
         fill_scale = self.scales['fill']
-        fill_scale.fit(molecule_abundance.stack(), 'Heatmap')
+        # a flat view is enough to fit the range; `stack()` would copy
+        # every element and build a MultiIndex just to be discarded
+        flat = Series(molecule_abundance.to_numpy().ravel())
+        if flat.isna().values.any():
+            # `stack()` dropped missing values implicitly
+            flat = flat.dropna()
+        fill_scale.fit(flat, 'Heatmap')
 
         return self.heatmap(
             plot,
@@ -320,12 +353,21 @@ class Heatmap(PlotComponent):
     def __add__(self, other):
         result = copy(self)
         result.scales = copy(result.scales)
-        if isinstance_permissive(other, Scale):
+        # exact isinstance first; the permissive fallbacks only matter
+        # after IPython reloads
+        if isinstance(other, Scale):
             result.scales[other.aesthetic] = other
-        elif isinstance_permissive(other, GuidesCollection):
+        elif isinstance(other, GuidesCollection):
             # + guides()
             for k, v in other.items():
                 result.scales[k].guide = v
+        elif isinstance(other, Dendrogram):
+            result.dendrograms[other.axis] = other
+        elif isinstance_permissive(other, Scale):
+            result.scales[other.aesthetic] = other
+        elif isinstance_permissive(other, GuidesCollection):
+            for k, v in other.items():
+                result.scales[k].guide = v
         elif isinstance_permissive(other, Dendrogram):
             result.dendrograms[other.axis] = other
         return result
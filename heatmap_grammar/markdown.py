@@ -1,10 +1,16 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from rpy2.robjects.packages import importr
 from .r import complex_heatmap
 
 
-_grid_text_loaded = False
+@lru_cache(maxsize=1)
+def _ensure_gridtext():
+    # import gridtext to avoid obtrusive message
+    # "Loading required namespace: gridtext"
+    # TODO: tell users they need to install it if import fails
+    importr('gridtext')
 
 
 @dataclass
@@ -13,13 +19,7 @@ class MarkdownData:
 
     @property
     def wrapper(self) -> Any:
-        global _grid_text_loaded
-        if not _grid_text_loaded:
-            # import gridtext to avoid obtrusive message
-            # "Loading required namespace: gridtext"
-            # TODO: tell users they need to install it if import fails
-            importr('gridtext')
-            grid_text_loaded = True
+        _ensure_gridtext()
         return complex_heatmap.gt_render(self.text)
 
     def __str__(self):
@@ -1,22 +1,53 @@
 from __future__ import annotations
 from abc import abstractmethod
-from copy import copy, deepcopy
+from copy import copy
 from dataclasses import dataclass, field
 from functools import reduce
 from typing import Generic, TypeVar
 from warnings import warn
 
-from pandas import DataFrame, Series, concat
+from numpy import asarray, concatenate
+from pandas import DataFrame, Index, Series
 from rpy2.robjects.packages import importr
 from rpy2.rinterface import rternalize
 
 from .constants import unset
 from .markdown import MarkdownData
 from .r import complex_heatmap, base
+from .rpy2_helpers import py2r_vector
 from .utils import isinstance_permissive
 
-_add = base._env['+']
-_vertical_concatenate = complex_heatmap._env['%v%']
+def _copy_theme(theme: dict) -> dict:
+    """Shallow theme copy; only the legend lists are mutated downstream.
+
+    `deepcopy` would recurse into the rpy2 legend objects, which is
+    slow and may even touch R's garbage collector.
+    """
+    result = dict(theme)
+    for key in ('heatmap_legend_list', 'annotation_legend_list'):
+        if key in result:
+            result[key] = list(result[key])
+    return result
+
+
+# the operator closures are resolved lazily so that importing the module
+# does not boot R, but only once: an R environment lookup per reduce step
+# would add up on plots with many components
+_r_operators: dict = {}
+
+
+def _add(a, b):
+    plus = _r_operators.get('+')
+    if plus is None:
+        plus = _r_operators['+'] = base._env['+']
+    return plus(a, b)
+
+
+def _vertical_concatenate(a, b):
+    operator = _r_operators.get('%v%')
+    if operator is None:
+        operator = _r_operators['%v%'] = complex_heatmap._env['%v%']
+    return operator(a, b)
 
 
 class Plot:
@@ -29,33 +60,66 @@ class Plot:
         self._size = {}
         self.row_split = None
         self.column_split = None
+        # legends collected on first draw; invalidated whenever the
+        # component list changes
+        self._legends_cache = None
 
     def _check_data_integrity(self):
         if len(self.components) < 2:
             return
         first = self.components[0]
+        first_rows = first.rows
         for component in self.components[1:]:
-            if len(first.rows) != len(component.rows):
+            component_rows = component.rows
+            if len(first_rows) != len(component_rows):
                 raise ValueError(
                     'Rows number out of agreement between components'
-                    f' {first.__class__} with {len(first.rows)} rows and'
-                    f' {component.__class__} with {len(component.rows)} rows'
+                    f' {first.__class__} with {len(first_rows)} rows and'
+                    f' {component.__class__} with {len(component_rows)} rows'
                 )
-            if not all(first.rows == component.rows):
+            # `equals` short-circuits on identity and compares in C;
+            # `all(a == b)` would build a boolean vector and loop over it
+            if not (
+                first_rows is component_rows
+                or first_rows.equals(component_rows)
+            ):
                 raise ValueError(
                     'Rows out of agreement between components'
-                    f' {first.rows} and {component.rows}'
+                    f' {first_rows} and {component_rows}'
                 )
 
     def __add__(self, other):
         if other is None:
             return self
         result = copy(self)
-        result.theme = deepcopy(result.theme)
+        result.theme = _copy_theme(result.theme)
+        # the list must not be shared with the source plot: appending
+        # into it would grow the source's components while its legend
+        # cache still reflects the old list
+        result.components = list(result.components)
+        result._legends_cache = None
+
+        # exact isinstance first; the permissive MRO-walking checks only
+        # run when the cheap check misses (IPython reloading)
+        if isinstance(other, PlotComponent):
+            is_theme = False
+            is_component = True
+        else:
+            is_theme = isinstance_permissive(other, Theme)
+            is_component = (
+                not is_theme
+                and isinstance_permissive(other, PlotComponent)
+            )
 
-        if isinstance_permissive(other, Theme):
-            result.theme.update(other.__dict__)
-        elif not isinstance_permissive(other, PlotComponent):
+        if is_theme:
+            for key, value in other.__dict__.items():
+                # resolve markdown once at merge time rather than on
+                # every draw; this also keeps `gridtext` lazy until a
+                # markdown value is actually used
+                if isinstance_permissive(value, MarkdownData):
+                    value = value.wrapper
+                result.theme[key] = value
+        elif not is_component:
             result.components[-1] += other
         else:
             if (
@@ -68,7 +132,7 @@ class Plot:
                 existing = getattr(result, name)
                 if existing is not None:
                     assert all(existing == split)
-                setattr(result, name, base.c(*split))
+                setattr(result, name, py2r_vector(split))
             other.attach(result)
             result.components.append(other)
         result._check_data_integrity()
@@ -76,6 +140,8 @@ class Plot:
 
     def __truediv__(self, other):
         result = copy(self)
+        result.components = list(result.components)
+        result._legends_cache = None
         assert result.components
         last_component = result.components[-1]
         if not isinstance(last_component, VerticalGroup):
@@ -110,30 +176,43 @@ class Plot:
 
         plot = reduce(_add, component_plots[1:], component_plots[0])
 
-        theme = deepcopy(self.theme)
+        theme = _copy_theme(self.theme)
+
+        if self._legends_cache is None:
+            # collected only after `create()` above: that is what fits
+            # the scales whose legends are gathered here
+            collected = []
+            collected_ids = set()
+            for c in self.components:
+                if hasattr(c, 'legends'):
+                    for legend in c.legends:
+                        if id(legend) not in collected_ids:
+                            collected_ids.add(id(legend))
+                            collected.append(legend)
+            self._legends_cache = collected
 
         legends = theme['heatmap_legend_list']
-        for c in self.components:
-            if hasattr(c, 'legends'):
-                for legend in c.legends:
-                    if legend not in legends:
-                        legends.append(legend)
+        # dedupe by identity: `in` would call `__eq__` on rpy2 objects
+        # (which may round-trip to R) and scales quadratically
+        seen = {id(legend) for legend in legends}
+        for legend in self._legends_cache:
+            if id(legend) not in seen:
+                seen.add(id(legend))
+                legends.append(legend)
 
         for key in ['row_split', 'column_split']:
             value = getattr(self, key)
             if value is not None:
                 theme[key] = value
 
+        # markdown values were already resolved to wrappers when the
+        # theme was merged in `__add__`
         ht_list = complex_heatmap.draw(
             plot,
             **{
-                k: (
-                    v.wrapper
-                    if isinstance_permissive(v, MarkdownData) else
-                    v
-                )
+                k: v
                 for k, v in theme.items()
-                if v != unset
+                if v is not unset
             }
         )
 
@@ -232,11 +311,13 @@ class VerticalGroup(PlotComponent):
         )
 
     @property
-    def rows(self) -> Series:
-        return concat(
-            member.rows
+    def rows(self) -> Index:
+        # member `rows` are Index objects; one numpy concatenation
+        # avoids the pairwise copies (and object fallback) of `concat`
+        return Index(concatenate([
+            asarray(member.rows)
             for member in self.members
-        )
+        ]))
 
     def __add__(self, component: PlotComponent):
         # TODO
@@ -1,8 +1,33 @@
 from rpy2.robjects.packages import importr
 
 
-complex_heatmap = importr('ComplexHeatmap')
-circlize = importr('circlize')
-base = importr('base')
-stats = importr('stats')
-grid = importr('grid')
+class LazyRPackage:
+    """Defer `importr` until first attribute access.
+
+    Loading the R packages dominates the import time of this library;
+    deferring it means R only boots once a plot element actually needs it.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._package = None
+
+    def __getattr__(self, attribute):
+        if self._package is None:
+            self._package = importr(self._name)
+        value = getattr(self._package, attribute)
+        # store the resolved symbol on the proxy so that later lookups
+        # (e.g. `base.c` in hot loops) bypass `__getattr__` altogether
+        setattr(self, attribute, value)
+        return value
+
+    def __repr__(self):
+        return f'LazyRPackage({self._name!r})'
+
+
+complex_heatmap = LazyRPackage('ComplexHeatmap')
+circlize = LazyRPackage('circlize')
+base = LazyRPackage('base')
+stats = LazyRPackage('stats')
+grid = LazyRPackage('grid')
+r_color_brewer = LazyRPackage('RColorBrewer')
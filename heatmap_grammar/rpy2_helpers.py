@@ -1,9 +1,13 @@
 from warnings import warn
+from numpy import asarray, asfortranarray
 from rpy2.robjects import pandas2ri, default_converter, conversion
 from rpy2.robjects.conversion import localconverter
 from rpy2.rinterface import SexpClosure, SexpExtPtr, parse
+from rpy2.rinterface import (
+    BoolSexpVector, FloatSexpVector, IntSexpVector, NA_Character,
+    StrSexpVector
+)
 from rpy2.rinterface_lib.sexp import baseenv
-from rpy2.rinterface import LangSexpVector
 from collections import defaultdict
 from typing import Callable
 import inspect
@@ -12,41 +16,95 @@ from .r import base
 
 def r_dict(p_dict: dict, value_type: type = None):
     if value_type is not None:
-        p_dict = {
-            k: value_type(v)
-            for k, v in p_dict.items()
-        }
+        # skip the conversion pass when every value already has the type
+        if not all(type(v) is value_type for v in p_dict.values()):
+            p_dict = {
+                k: value_type(v)
+                for k, v in p_dict.items()
+            }
     else:
-        types = {type(v) for v in p_dict.values()}
-        if len(types) > 1:
-            warn(
-                f'The values of Python dict include multiple types: {types}'
-                ' which may result in an R vector of a type other than expected;'
-                ' pass `value_type` to coerce the values to the given type.'
-            )
+        values = iter(p_dict.values())
+        first_type = type(next(values, None))
+        for value in values:
+            if type(value) is not first_type:
+                warn(
+                    'The values of Python dict include multiple types'
+                    f' (e.g. {first_type.__name__} and {type(value).__name__})'
+                    ' which may result in an R vector of a type other than expected;'
+                    ' pass `value_type` to coerce the values to the given type.'
+                )
+                break
     return base.c(**{
         str(k): v
         for k, v in p_dict.items()
     })
 
 
+def py2r_vector(values):
+    """Convert a 1-D numpy array (or pandas Series) to an R vector.
+
+    `base.c(*values)` boxes every element as a separate Python argument;
+    picking a typed SEXP constructor once lets rpy2 fill the vector
+    from the buffer in bulk instead.
+    """
+    values = asarray(values)
+    kind = values.dtype.kind
+    if kind == 'b':
+        return BoolSexpVector(values)
+    if kind in 'iu':
+        if len(values) and (
+            values.min() < -2**31 + 1 or values.max() > 2**31 - 1
+        ):
+            # `astype('int32')` would silently wrap; R itself represents
+            # numbers beyond integer range as doubles
+            return FloatSexpVector(values.astype('float64'))
+        return IntSexpVector(values.astype('int32', copy=False))
+    if kind == 'f':
+        return FloatSexpVector(values.astype('float64', copy=False))
+    return StrSexpVector([
+        # `v != v` catches float('nan') placed in object arrays
+        NA_Character if v is None or v != v else str(v)
+        for v in values
+    ])
+
+
+def df_to_r_matrix(df):
+    """Convert an all-numeric DataFrame to an R matrix in one buffer copy.
+
+    The generic pandas converter builds an R data.frame column by
+    column; a numeric matrix can instead be handed over as a single
+    column-major buffer with the dimnames attached afterwards.
+    """
+    values = asfortranarray(df.to_numpy(dtype='float64'))
+    return base.matrix(
+        FloatSexpVector(values.ravel(order='F')),
+        nrow=values.shape[0],
+        ncol=values.shape[1],
+        dimnames=base.list(
+            StrSexpVector([str(name) for name in df.index]),
+            StrSexpVector([str(name) for name in df.columns])
+        )
+    )
+
+
+# composed once: the converter merge itself is not free and these
+# helpers run once per heatmap and once per annotation
+_pandas_converter = default_converter + pandas2ri.converter
+
+
 def rpy2py(x):
-    with localconverter(default_converter + pandas2ri.converter):
+    with localconverter(_pandas_converter):
         return conversion.rpy2py(x)
 
 
 def py2rpy(x):
-    with localconverter(default_converter + pandas2ri.converter):
+    with localconverter(_pandas_converter):
         return conversion.py2rpy(x)
 
 
-def find_first(nodes, of_type):
-    candidates = [
-        node
-        for node in nodes
-        if isinstance(node, of_type)
-    ]
-    return candidates[0]
+# factories evaluated once per signature shape: `parse` + `eval` through
+# rpy2 are the dominant cost when many small callbacks are wrapped
+_SIGNATURE_FACTORY_CACHE: dict = {}
 
 
 def rternalize_with_signature(function: Callable) -> SexpClosure:
@@ -60,29 +118,11 @@ def rternalize_with_signature(function: Callable) -> SexpClosure:
         params[param.kind].append(name)
 
     # any *args or **kwargs?
-    has_var_params = (
+    has_var_params = bool(
         params[inspect.Parameter.VAR_POSITIONAL]
         or params[inspect.Parameter.VAR_KEYWORD]
     )
 
-    params_r_sig = [
-        *params[inspect.Parameter.POSITIONAL_ONLY],
-        *params[inspect.Parameter.POSITIONAL_OR_KEYWORD],
-        *params[inspect.Parameter.KEYWORD_ONLY]
-    ]
-    if has_var_params:
-        params_r_sig.append('...')
-    r_func_args = ', '.join(params_r_sig)
-
-    arguments_code = ''
-
-    # always pass positional-only arguments, let Python throw error if missing
-    if params[inspect.Parameter.POSITIONAL_ONLY]:
-        positionals = ', '.join(params[inspect.Parameter.POSITIONAL_ONLY])
-        arguments_code += """
-        RPY2_ARGUMENTS <- base::c(RPY2_ARGUMENTS, base::list(%s))
-        """ % positionals
-
     # treat all params which might be default as potentially missing
     # (regardless of whether they are default or not as we cannot
     # reflect the Python signature in R 1-1, so instead let's allow
@@ -92,47 +132,79 @@ def rternalize_with_signature(function: Callable) -> SexpClosure:
         *params[inspect.Parameter.KEYWORD_ONLY]
     ]
 
-    for param in possibly_default:
-        arguments_code += f"""
-        if (!base::missing({param})) {{
-            RPY2_ARGUMENTS[['{param}']] <- {param}
-        }}
+    signature_key = (
+        tuple(params[inspect.Parameter.POSITIONAL_ONLY]),
+        tuple(possibly_default),
+        has_var_params
+    )
+    factory = _SIGNATURE_FACTORY_CACHE.get(signature_key)
+
+    if factory is None:
+        positional_only = params[inspect.Parameter.POSITIONAL_ONLY]
+        params_r_sig = [
+            *positional_only,
+            *possibly_default
+        ]
+        if has_var_params:
+            params_r_sig.append('...')
+        r_func_args = ', '.join(params_r_sig)
+
+        # one snapshot of the call environment replaces a conditional
+        # `RPY2_ARGUMENTS[['p']] <- p` (each copying the list) per
+        # keyword parameter; missing arguments show up in the snapshot
+        # as empty symbols and are filtered out
+        collect_code = """
+        RPY2_KEYWORD <- base::as.list(base::environment())
         """
-
-    if has_var_params:
-        arguments_code += """
-        RPY2_ARGUMENTS <- base::c(
-            RPY2_ARGUMENTS,
-            ...
-        )
+        if positional_only:
+            positional_names = ', '.join(
+                f'"{name}"' for name in positional_only
+            )
+            collect_code += f"""
+            RPY2_KEYWORD <- RPY2_KEYWORD[
+                !(base::names(RPY2_KEYWORD) %in% base::c({positional_names}))
+            ]
+            """
+        collect_code += """
+        RPY2_KEYWORD <- RPY2_KEYWORD[
+            !base::vapply(RPY2_KEYWORD, base::is.symbol, base::logical(1))
+        ]
         """
 
-    template = parse(f"""
-    function({r_func_args}) {{
-        RPY2_ARGUMENTS <- base::list(
-           ".Python",
-           RPY2_FUN_PLACEHOLDER
-        )
-
-        {arguments_code}
-
-        do.call(
-           .External,
-           RPY2_ARGUMENTS
-        );
-    }}
-    """)
-
-    function_definition = find_first(template, of_type=LangSexpVector)
-    function_body = find_first(function_definition, of_type=LangSexpVector)
-
-    list_assignment = find_first(function_body, of_type=LangSexpVector)
-
-    args_list = find_first(list_assignment, of_type=LangSexpVector)
-
-    assert str(args_list[2]) == 'RPY2_FUN_PLACEHOLDER'
-    args_list[2] = rpy_fun
+        # positional-only arguments are passed unnamed and always, let
+        # Python throw an error if missing
+        argument_pieces = ['base::list(".Python", RPY2_FUN)']
+        if positional_only:
+            argument_pieces.append(
+                'base::list(%s)' % ', '.join(positional_only)
+            )
+        argument_pieces.append('RPY2_KEYWORD')
+        if has_var_params:
+            argument_pieces.append('base::list(...)')
+        arguments_code = ',\n'.join(argument_pieces)
+
+        # the Python function pointer is passed into the factory rather
+        # than patched into the parse tree, so one evaluated factory can
+        # produce closures for every function of this signature shape
+        template = parse(f"""
+        function(RPY2_FUN) {{
+            function({r_func_args}) {{
+                {collect_code}
+
+                RPY2_ARGUMENTS <- base::c(
+                    {arguments_code}
+                )
+
+                do.call(
+                   .External,
+                   RPY2_ARGUMENTS
+                );
+            }}
+        }}
+        """)
+        factory = baseenv['eval'](template)
+        _SIGNATURE_FACTORY_CACHE[signature_key] = factory
 
-    res = baseenv['eval'](template)
+    res = factory(rpy_fun)
     res.__nested_sexp__ = rpy_fun.__sexp__
     return res
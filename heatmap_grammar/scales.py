@@ -1,18 +1,18 @@
 from __future__ import annotations
 from copy import copy
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Literal, Union, Iterable
 from warnings import warn
 
-from numpy import linspace
-from pandas import Series
-from rpy2.robjects.packages import importr
+from numpy import array, asarray, linspace
+from pandas import Categorical, Series, isna
 
-from .guides import Guide, GuideType, GUIDE_REGISTER
+from .guides import Guide, GuideType, GUIDE_PROTOTYPES
 from .markdown import MarkdownData
 from .constants import required, unset
-from .r import base, stats, circlize
-from .rpy2_helpers import rpy2py
+from .r import base, stats, circlize, r_color_brewer
+from .rpy2_helpers import rpy2py, py2r_vector
 from .utils import isinstance_permissive, check_required
 
 
@@ -29,6 +29,13 @@ class Scale:
     name: str | MarkdownData = unset
     na_value: str = 'grey50'
     _fitted: bool = field(default=False, init=False)
+    _guide_cache: 'Guide | None' = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _fit_data: Any = field(default=None, init=False, repr=False, compare=False)
+    _fitted_vector: Any = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         check_required(self)
@@ -38,14 +45,23 @@ class Scale:
             self.name = name
         assert isinstance(self.name, str) or isinstance_permissive(self.name, MarkdownData)
         self._fitted = True
+        self._fit_data = data
+        self._fitted_vector = None
+        # `guide` may have been swapped (e.g. by `+ guides(...)`) since
+        # the last render; re-solve on the next `legend`/`params` access
+        self._guide_cache = None
+        for cached in ('legend', 'params', 'heatmap_col'):
+            self.__dict__.pop(cached, None)
         self._guide_params = self._prepare_params()
 
-    @property
+    # invariant once fitted, so the R-side legend construction runs at
+    # most once per fit; `fit()` drops the cached entries
+    @cached_property
     def legend(self):
         guide = self._solve_guide()
         return guide.legend(**self._guide_params)
 
-    @property
+    @cached_property
     def params(self):
         guide = self._solve_guide()
         return guide.params(**self._guide_params)
@@ -53,6 +69,19 @@ class Scale:
     def compute(self, data: Series):
         raise NotImplementedError()
 
+    def _data_vector(self, data: Series):
+        """R vector of the data, cached when `compute` follows `fit`.
+
+        Within one render `fit` and `compute` typically receive the very
+        same Series, so the conversion can be shared; any other Series
+        is converted afresh.
+        """
+        if data is self._fit_data:
+            if self._fitted_vector is None:
+                self._fitted_vector = py2r_vector(data.to_numpy())
+            return self._fitted_vector
+        return py2r_vector(data.to_numpy())
+
     def _prepare_params(self) -> dict:
         """Parameters used for legend (guide) preparation."""
         raise NotImplementedError()
@@ -62,10 +91,13 @@ class Scale:
             raise ValueError('Scale was not fitted, call .fit(data, name) first!')
 
     def _solve_guide(self) -> Guide:
-        if isinstance(self.guide, str) or self.guide is None:
-            guide = GUIDE_REGISTER[self.guide]()
-        else:
-            guide = self.guide
+        guide = self._guide_cache
+        if guide is None:
+            if isinstance(self.guide, str) or self.guide is None:
+                guide = copy(GUIDE_PROTOTYPES[self.guide])
+            else:
+                guide = self.guide
+            self._guide_cache = guide
         return guide
 
     @property
@@ -82,8 +114,8 @@ class scale_identity(Scale):
 
     def compute(self, data: Series):
         return stats.setNames(
-            base.c(*data.apply(str).to_list()),
-            base.c(*data.to_list())
+            py2r_vector(data.astype(str).to_numpy()),
+            self._data_vector(data)
         )
 
     def _prepare_params(self):
@@ -100,6 +132,26 @@ class scale_manual(Scale):
     values: Dict[Any, str] = required
     limits: Limits = None
     labels: Dict[Any, str] = None
+    _color_lookup: Any = field(default=None, init=False, repr=False, compare=False)
+    _categories: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def fit(self, data: Series, name: str | MarkdownData):
+        # a null key (as produced by `data.unique()` on a column with
+        # missing values) cannot become a Categorical category; its
+        # color is served through the missing-value code of -1 instead,
+        # which indexes the last slot of the lookup array. Unmatched
+        # values without such a key get the None sentinel (-> NA in R).
+        keys = list(self.values)
+        null_keys = [key for key in keys if isna(key)]
+        self._categories = [key for key in keys if not isna(key)]
+        self._color_lookup = array(
+            [
+                *(self.values[key] for key in self._categories),
+                self.values[null_keys[0]] if null_keys else None
+            ],
+            dtype=object
+        )
+        super().fit(data, name)
 
     def _prepare_params(self):
         labels = copy(self.labels)
@@ -125,16 +177,21 @@ class scale_manual(Scale):
 
     def compute(self, data: Series):
         self._check_fited()
+        # a C-level gather over the categorical codes replaces one
+        # Python dict lookup per row
+        codes = Categorical(data, categories=self._categories).codes
         return stats.setNames(
-            base.c(*data.map(self.values).to_list()),
-            base.c(*data.to_list())
+            py2r_vector(self._color_lookup[codes]),
+            self._data_vector(data)
         )
 
-    @property
+    @cached_property
     def heatmap_col(self):
+        # both vectors converted in bulk; passing Python lists would walk
+        # the generic converter element by element
         return base.structure(
-            list(self.values.values()),
-            names=list(self.values.keys())
+            py2r_vector([*self.values.values()]),
+            names=py2r_vector([str(key) for key in self.values])
         )
 
 
@@ -171,10 +228,8 @@ class scale_brewer(scale_manual):
     palette: str = 'Set1'
 
     def fit(self, data: Series, name: str | MarkdownData):
-        brewer = importr('RColorBrewer')
-
         values = data.unique()
-        colors = rpy2py(brewer.brewer_pal(
+        colors = rpy2py(r_color_brewer.brewer_pal(
             n=len(values),
             name=self.palette
         ))
@@ -194,6 +249,9 @@ class scale_gradient_n(Scale):
     quantiles: list[float] = field(default_factory=lambda: [0, 1])
     symmetrical: bool = False
     color_ramp_kwargs: dict = field(default_factory=dict, init=False)
+    _cached_color_function: Any = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self.colors = list(self.colors)
@@ -208,14 +266,12 @@ class scale_gradient_n(Scale):
     def fit(self, data: Series, name: str | MarkdownData):
         if self.limits is None:
             assert self.quantiles[0] <= self.quantiles[1]
-            limits = [
-                data.quantile(self.quantiles[0]),
-                data.quantile(self.quantiles[1])
-            ]
+            # both quantiles computed in a single pass over the data
+            limits = data.quantile(self.quantiles).to_list()
             if self.symmetrical:
                 if limits[0] > 0 or limits[1] < 0:
                     warn('Symmetrical gradient requested, but interval does not include zero')
-                larger = max([abs(lim) for lim in limits])
+                larger = max(abs(limits[0]), abs(limits[1]))
                 limits = [
                     -larger,
                     larger
@@ -224,13 +280,15 @@ class scale_gradient_n(Scale):
             limits = self.limits
             assert not self.symmetrical
         limits = [float(x) for x in limits]
+        # kept as a contiguous float array: it feeds the colorRamp2
+        # breaks through a single buffer conversion
         if self.points is unset:
-            self.fitted_points = [
-                float(x)
-                for x in self.fit_points(limits)
-            ]
+            self.fitted_points = asarray(self.fit_points(limits), dtype=float)
         else:
-            self.fitted_points = self.points
+            self.fitted_points = asarray(self.points, dtype=float)
+        # fitting moves the breaks, so the ramp has to be rebuilt;
+        # invalidate before `super().fit` prepares the guide parameters
+        self._cached_color_function = None
         super().fit(data, name)
 
     def _prepare_params(self):
@@ -250,23 +308,29 @@ class scale_gradient_n(Scale):
 
     @property
     def _color_function(self):
-        self._check_fited()
-        assert self.colors is not required
-        return circlize.colorRamp2(
-            breaks=base.c(*self.fitted_points),
-            colors=base.c(*self.colors),
-            space=self.space,
-            **self.color_ramp_kwargs
-        )
+        if self._cached_color_function is None:
+            self._check_fited()
+            assert self.colors is not required
+            self._cached_color_function = circlize.colorRamp2(
+                breaks=py2r_vector(self.fitted_points),
+                colors=py2r_vector(self.colors),
+                space=self.space,
+                **self.color_ramp_kwargs
+            )
+        return self._cached_color_function
 
     def compute(self, data: Series):
         self._check_fited()
+        # the interpolation itself runs in circlize's compiled code;
+        # one bulk-converted vector serves both as the input and as
+        # the names (setNames coerces its copy to character)
+        vector = self._data_vector(data)
         return stats.setNames(
-            self._color_function(base.c(*data.to_list())),
-            base.c(*data.to_list())
+            self._color_function(vector),
+            vector
         )
 
-    @property
+    @cached_property
     def heatmap_col(self):
         return self._color_function
 
@@ -4,6 +4,11 @@ from typing import Literal
 from .r import grid
 
 
+# the same few units (gaps, annotation sizes) are converted over and
+# over per plot; the R objects are never mutated so they can be shared
+_UNIT_CACHE: dict = {}
+
+
 @dataclass
 class Unit:
     x: float
@@ -30,6 +35,12 @@ class Unit:
     data: str | None = None
 
     def to_r(self):
-        if self.data is not None:
-            return grid.unit(float(self.x), self.units, self.data)
-        return grid.unit(float(self.x), self.units)
+        key = (self.x, self.units, self.data)
+        cached = _UNIT_CACHE.get(key)
+        if cached is None:
+            if self.data is not None:
+                cached = grid.unit(float(self.x), self.units, self.data)
+            else:
+                cached = grid.unit(float(self.x), self.units)
+            _UNIT_CACHE[key] = cached
+        return cached
@@ -1,20 +1,43 @@
+from functools import lru_cache
 from typing import Union, Literal
 from .constants import required
 
 Side = Union[Literal['top', 'bottom', 'left', 'right']]
 
 
+@lru_cache(maxsize=None)
+def _name_in_mro(obj_cls: type, name: str) -> bool:
+    # cached per (class, name) pair: the answer cannot change for a
+    # given class object, even across IPython reloads (those produce
+    # new class objects and thus new cache entries)
+    return any(
+        class_.__name__ == name
+        for class_ in obj_cls.mro()
+    )
+
+
 def isinstance_permissive(obj, cls):
     """isinstance but permissive for IPython reloading where object
     hierarhies may diverge and need to check by name; does not check full mro.
     """
-    return isinstance(obj, cls) or any([
-        class_.__name__ == cls.__name__
-        for class_ in obj.__class__.mro()
-    ])
+    return isinstance(obj, cls) or _name_in_mro(type(obj), cls.__name__)
+
+
+@lru_cache(maxsize=None)
+def _required_fields(cls: type) -> tuple:
+    # only fields defaulting to `required` can be left unset, so the
+    # scan over all instance attributes reduces to this fixed tuple
+    fields = getattr(cls, '__dataclass_fields__', None)
+    if fields is None:
+        return ()
+    return tuple(
+        name
+        for name, field_ in fields.items()
+        if field_.default is required
+    )
 
 
 def check_required(obj):
-    for k, v in vars(obj).items():
-        if v is required:
+    for k in _required_fields(type(obj)):
+        if getattr(obj, k) is required:
             raise ValueError(f'Missing required argument: {k}')
\ No newline at end of file